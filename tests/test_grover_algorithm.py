@@ -1,5 +1,6 @@
+import functools
 import unittest
-from qiskit import QuantumCircuit, execute, Aer
+from qiskit import QuantumCircuit, transpile, Aer
 from qiskit.circuit.library import GroverOperator  # Import GroverOperator
 import sys
 import os
@@ -9,10 +10,22 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from grover_algorithm import GroverAlgorithm  # Import your main class
 
+_SIMULATOR = Aer.get_backend('qasm_simulator')
+
+@functools.lru_cache(maxsize=None)
+def _simulate(n, solutions, shots=1000):
+    """Builds and simulates the Grover circuit once per unique (n, solutions).
+
+    Several tests exercise the same parameters; caching the counts means
+    each unique circuit is transpiled and simulated a single time.
+    """
+    circuit = GroverAlgorithm().create_circuit(n, list(solutions))
+    result = _SIMULATOR.run(transpile(circuit, _SIMULATOR), shots=shots).result()
+    return result.get_counts()
+
 class TestGroverAlgorithm(unittest.TestCase):
     def setUp(self):
         self.grover = GroverAlgorithm()
-        self.simulator = Aer.get_backend('qasm_simulator')
 
     def test_oracle_single_solution(self):
         # Test oracle for single solution case
@@ -22,18 +35,14 @@ class TestGroverAlgorithm(unittest.TestCase):
 
     def test_case1_single_solution(self):
         # Test Case 1: Single solution
-        circuit = self.grover.create_circuit(4, [1])
-        result = execute(circuit, self.simulator, shots=1000).result()
-        counts = result.get_counts()
+        counts = _simulate(4, (1,))
         # Check if the most frequent outcome is the solution
         most_frequent = max(counts, key=counts.get)
         self.assertEqual(most_frequent, '0001')
 
     def test_case2_three_solutions(self):
         # Test Case 2: Three solutions
-        circuit = self.grover.create_circuit(4, [1, 3, 7])
-        result = execute(circuit, self.simulator, shots=1000).result()
-        counts = result.get_counts()
+        counts = _simulate(4, (1, 3, 7))
         # Verify solutions appear with significant probability
         total_prob = sum(counts[state] for state in ['0001', '0011', '0111'])
         self.assertGreater(total_prob / 1000, 0.7)  # 70% probability threshold
@@ -42,9 +51,8 @@ class TestGroverAlgorithm(unittest.TestCase):
         # Test Case 3: Seven solutions
         solutions = [1, 3, 5, 7, 9, 11, 13]
         circuit = self.grover.create_circuit(4, solutions)
-        result = execute(circuit, self.simulator, shots=1000).result()
-        counts = result.get_counts()
-        
+        counts = _simulate(4, tuple(solutions))
+
         # Verify circuit has correct number of iterations
         expected_iterations = self.grover.calculate_iterations(16, 7)
         
@@ -119,8 +127,7 @@ class TestGroverAlgorithm(unittest.TestCase):
         self.assertTrue(ops.count('measure') >= 2, "Circuit should end with measurements")
         
         # Test the output for the marked state
-        result = execute(circuit, self.simulator, shots=1000).result()
-        counts = result.get_counts()
+        counts = _simulate(2, (1,))
         print("Measurement results:", counts)
         self.assertIn('01', counts, "Marked state should be measured")
         self.assertGreater(counts.get('01', 0) / 1000, 0.5, 
@@ -141,8 +148,7 @@ class TestGroverAlgorithm(unittest.TestCase):
                         f"Wrong number of iterations: got {iterations}, expected {expected}")
         
         # Verify results
-        result = execute(circuit, self.simulator, shots=1000).result()
-        counts = result.get_counts()
+        counts = _simulate(3, tuple(solutions))
         print("Results distribution:", counts)
         
         # Check both solutions are found with good probability